@@ -0,0 +1,10 @@
+import logging
+import uvicorn
+
+from bot.slack_app import api
+
+# ==============================
+# Start Server
+# ==============================
+logging.basicConfig(level=logging.INFO)
+uvicorn.run(api, host="0.0.0.0", port=3000)
@@ -0,0 +1,15 @@
+import os
+from dotenv import load_dotenv
+
+# ==============================
+# Load Environment Variables
+# ==============================
+load_dotenv()
+
+SLACK_BOT_TOKEN = os.getenv("SLACK_BOT_TOKEN")
+SLACK_SIGNING_SECRET = os.getenv("SLACK_SIGNING_SECRET")
+DATABASE_URL = os.getenv("DATABASE_URL")
+GROQ_API_KEY = os.getenv("GROQ_API_KEY")
+
+# Set AI_MODE=0 to run with slash commands only (no @mention handling).
+AI_MODE = os.getenv("AI_MODE", "1") != "0"
@@ -0,0 +1,106 @@
+from contextlib import asynccontextmanager
+from psycopg_pool import AsyncConnectionPool
+
+from bot.config import DATABASE_URL
+
+# ==============================
+# Database Connection Pool
+# ==============================
+# Opened and closed by the FastAPI lifespan, inside the running event loop.
+db_pool = AsyncConnectionPool(
+    DATABASE_URL, min_size=2, max_size=10, max_idle=300, open=False
+)
+
+@asynccontextmanager
+async def get_conn():
+    # Checks out a pooled connection; commits on success, rolls back on
+    # error, and always hands the connection back to the pool.
+    async with db_pool.connection() as conn:
+        yield conn
+
+# ==============================
+# Tasks
+# ==============================
+# The task writes are the hot path, so they are executed with prepare=True:
+# psycopg prepares them once per pooled connection and reuses the plan.
+INSERT_TASK_SQL = """
+    INSERT INTO tasks (member_id, description, deadline)
+    VALUES (%s, %s, %s)
+"""
+
+# Looks the member up and inserts the task in one round trip. Each
+# candidate is a (name, description) split of the request; the longest
+# member name that matches wins. When none match, m is empty, nothing is
+# inserted and no row returns.
+ASSIGN_TASK_SQL = """
+    WITH candidates (name, description) AS (
+        SELECT * FROM unnest(%s::text[], %s::text[])
+    ),
+    m AS (
+        SELECT mem.member_id, mem.member_name, c.description
+        FROM candidates c
+        JOIN members mem ON lower(mem.member_name) = lower(c.name)
+        ORDER BY length(mem.member_name) DESC
+        LIMIT 1
+    ),
+    inserted AS (
+        INSERT INTO tasks (member_id, description, deadline)
+        SELECT member_id, description, %s::date FROM m
+        RETURNING member_id
+    )
+    SELECT m.member_name FROM m JOIN inserted USING (member_id)
+"""
+
+async def insert_task(member_id, description, deadline):
+    async with get_conn() as conn, conn.cursor() as cur:
+        await cur.execute(INSERT_TASK_SQL, (member_id, description, deadline), prepare=True)
+
+async def insert_task_by_name(candidates, deadline):
+    # candidates: [(member_name, description), ...]. Returns the name of the
+    # member the task went to, or None when no candidate is a member.
+    names = [name.strip() for name, _ in candidates]
+    descriptions = [description for _, description in candidates]
+
+    async with get_conn() as conn, conn.cursor() as cur:
+        await cur.execute(ASSIGN_TASK_SQL, (names, descriptions, deadline), prepare=True)
+        row = await cur.fetchone()
+
+    return row[0] if row else None
+
+# Soonest deadlines first; served by idx_tasks_member_deadline. One extra
+# row is fetched so callers can tell the list was cut short.
+MEMBER_TASKS_LIMIT = 50
+
+async def fetch_member_tasks(member_name):
+    async with get_conn() as conn, conn.cursor() as cur:
+        await cur.execute("""
+            SELECT t.description, t.deadline
+            FROM tasks t
+            JOIN members m ON t.member_id = m.member_id
+            WHERE lower(m.member_name) = lower(%s)
+            ORDER BY t.deadline ASC
+            LIMIT %s
+        """, (member_name.strip(), MEMBER_TASKS_LIMIT + 1))
+
+        return await cur.fetchall()
+
+# ==============================
+# Meetings
+# ==============================
+# Summaries are long, so they are shown a page at a time to stay well
+# under Slack's message size limit: /meetings page:2 shows older ones.
+MEETINGS_PAGE_SIZE = 20
+# Keeps OFFSET far from bigint overflow; 1000 pages is 20,000 meetings.
+MEETINGS_MAX_PAGE = 1000
+
+async def fetch_meetings_page(page):
+    async with get_conn() as conn, conn.cursor() as cur:
+        await cur.execute("""
+            SELECT m.meeting_date, t.transcription_summary
+            FROM meetings m
+            JOIN transcription t ON m.transcription_id = t.transcription_id
+            ORDER BY m.meeting_date DESC
+            LIMIT %s OFFSET %s
+        """, (MEETINGS_PAGE_SIZE, (page - 1) * MEETINGS_PAGE_SIZE))
+
+        return await cur.fetchall()
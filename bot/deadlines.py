@@ -0,0 +1,27 @@
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from dateutil import parser
+
+# ==============================
+# Deadline Parser
+# ==============================
+DEFAULT_DEADLINE_DAYS = 3
+
+# Dates are taken in UTC so they do not depend on the host's timezone.
+def today():
+    return datetime.now(timezone.utc).date()
+
+def default_deadline():
+    return today() + timedelta(days=DEFAULT_DEADLINE_DAYS)
+
+def parse_deadline(text):
+    return _parse_deadline(text, today().isoformat())
+
+# dateutil's fuzzy parse is slow and deadline phrases repeat a lot. Today's
+# date is part of the key because missing date parts are filled from it.
+@lru_cache(maxsize=1024)
+def _parse_deadline(text, today):
+    try:
+        return parser.parse(text, fuzzy=True, default=datetime.fromisoformat(today)).date()
+    except (ValueError, OverflowError):
+        return None
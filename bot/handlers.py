@@ -0,0 +1,257 @@
+import re
+import time
+import logging
+from functools import wraps
+
+from bot.db import (
+    MEETINGS_MAX_PAGE, MEETINGS_PAGE_SIZE, MEMBER_TASKS_LIMIT,
+    fetch_meetings_page, fetch_member_tasks, insert_task, insert_task_by_name
+)
+from bot.deadlines import default_deadline, parse_deadline
+from bot.llm import extract_intent
+from bot.roles import (
+    clear_role_cache, is_manager, member_id_for, refresh_members
+)
+
+log = logging.getLogger(__name__)
+
+# Each listener is registered as ack_only plus a lazy worker. Bolt sends the
+# ack response straight away and runs the worker in the background, so
+# Postgres and Groq latency never count against Slack's 3-second window.
+#
+# Lazy workers outlive the HTTP response, so they need a long-running
+# server (the FastAPI/uvicorn app in slack_app.py) or a FaaS adapter with
+# lazy listener support. Moving to a handler that stops the process once
+# the response is sent would silently drop them.
+
+def register(app, ai_mode=True):
+    app.command("/assign")(ack=ack_only, lazy=[timed(assign_task)])
+    app.command("/tasks")(ack=ack_only, lazy=[timed(fetch_tasks)])
+    app.command("/meetings")(ack=ack_only, lazy=[timed(fetch_meetings)])
+    app.command("/refresh-roles")(ack=ack_only, lazy=[timed(refresh_roles)])
+
+    if ai_mode:
+        app.event("app_mention")(ack=ack_only, lazy=[timed(handle_mention)])
+
+async def ack_only(ack):
+    await ack()
+
+def timed(listener):
+    # One structured line per invocation, so p50/p99 per handler can be
+    # read straight from the logs. wraps() keeps the signature Bolt uses
+    # to decide which arguments to inject. Bolt's lazy runner logs worker
+    # failures without a traceback, so the traceback is logged here.
+    @wraps(listener)
+    async def wrapper(**kwargs):
+        started = time.perf_counter()
+        outcome = "error"
+        try:
+            result = await listener(**kwargs)
+            outcome = "ok"
+            return result
+        except Exception:
+            log.exception("handler=%s failed", listener.__name__)
+            raise
+        finally:
+            log.info(
+                "handler=%s outcome=%s duration_ms=%.1f",
+                listener.__name__, outcome, (time.perf_counter() - started) * 1000
+            )
+
+    return wrapper
+
+MEMBER_NOT_FOUND = "❌ Member not found. Use the member's full name."
+
+async def _assign(candidates, deadline):
+    # candidates: [(member_name, description), ...], longest name first.
+    # Returns the name the task was assigned to, or None if no member matches.
+    for member_name, description in candidates:
+        member_id = member_id_for(member_name)
+        if member_id is not None:
+            await insert_task(member_id, description, deadline)
+            return member_name
+
+    # Not in the directory (e.g. added since the last refresh)
+    return await insert_task_by_name(candidates, deadline)
+
+def format_tasks(header, rows):
+    parts = [header]
+    parts.extend(
+        f"• {desc} (Deadline: {deadline})" for desc, deadline in rows[:MEMBER_TASKS_LIMIT]
+    )
+
+    if len(rows) > MEMBER_TASKS_LIMIT:
+        parts.append(f"_Showing the first {MEMBER_TASKS_LIMIT} tasks by deadline._")
+
+    return "\n".join(parts)
+
+def format_meetings(rows, page):
+    message = "*Meeting Transcriptions:*\n\n" + "\n\n".join(
+        f"*Date:* {date}\n{summary}" for date, summary in rows
+    )
+
+    if len(rows) == MEETINGS_PAGE_SIZE:
+        message += f"\n\n_Older meetings: /meetings page:{page + 1}_"
+
+    return message
+
+# =====================================================
+# SLASH COMMAND: /assign
+# =====================================================
+async def assign_task(respond, command):
+    slack_user_id = command["user_id"]
+
+    if not await is_manager(slack_user_id):
+        await respond("❌ Only Managers can assign tasks.")
+        return
+
+    parts = command["text"].split()
+
+    if len(parts) < 3:
+        await respond("Usage: /assign member_name description deadline")
+        return
+
+    # Names can be several words long ("Ravi Kumar"), so every run of
+    # leading words is a candidate name. At least one word each is left
+    # for the description and the deadline.
+    deadline = parts[-1]
+    candidates = [
+        (" ".join(parts[:n]), " ".join(parts[n:-1]))
+        for n in range(len(parts) - 2, 0, -1)
+    ]
+
+    assigned_to = await _assign(candidates, deadline)
+
+    if not assigned_to:
+        await respond(MEMBER_NOT_FOUND)
+        return
+
+    await respond(f"✅ Task assigned to {assigned_to}.")
+
+# =====================================================
+# SLASH COMMAND: /tasks
+# =====================================================
+async def fetch_tasks(respond, command):
+    rows = await fetch_member_tasks(command["text"])
+
+    if not rows:
+        await respond("No tasks found.")
+    else:
+        await respond(format_tasks("*Tasks:*", rows))
+
+# =====================================================
+# SLASH COMMAND: /meetings
+# =====================================================
+async def fetch_meetings(respond, command):
+    match = re.search(r"page:(\d+)", command["text"])
+    digits = (match.group(1) if match else "1").lstrip("0") or "0"
+
+    # Check the length first: int() rejects strings over 4300 digits
+    too_long = len(digits) > len(str(MEETINGS_MAX_PAGE))
+    if too_long or int(digits) > MEETINGS_MAX_PAGE:
+        await respond(f"⚠️ No such page. Pages go up to {MEETINGS_MAX_PAGE}.")
+        return
+
+    page = max(int(digits), 1)
+
+    rows = await fetch_meetings_page(page)
+
+    if not rows:
+        await respond("No meeting summaries found.")
+    else:
+        await respond(format_meetings(rows, page))
+
+# =====================================================
+# SLASH COMMAND: /refresh-roles
+# =====================================================
+async def refresh_roles(respond, command):
+    if not await is_manager(command["user_id"]):
+        await respond("❌ Only Managers can refresh roles.")
+        return
+
+    clear_role_cache()
+    await refresh_members()
+    await respond("🔄 Member directory and role cache refreshed.")
+
+# =====================================================
+# AI MODE: @Mention
+# =====================================================
+async def handle_mention(body, say):
+    slack_user_id = body["event"]["user"]
+    text = body["event"]["text"]
+
+    ai_data = await extract_intent(text)
+
+    if not ai_data:
+        await say("⚠️ I couldn't understand your request.")
+        return
+
+    intent = ai_data.get("intent")
+    member_name = ai_data.get("member_name")
+    description = ai_data.get("description")
+    deadline_text = ai_data.get("deadline")
+
+    # ======================
+    # VIEW TASKS
+    # ======================
+    if intent == "view_tasks":
+
+        if not member_name:
+            await say("⚠️ Please specify a member name.")
+            return
+
+        rows = await fetch_member_tasks(member_name)
+
+        if not rows:
+            await say(f"No tasks found for {member_name}.")
+        else:
+            await say(format_tasks(f"*Tasks for {member_name}:*", rows))
+
+        return
+
+    # ======================
+    # VIEW MEETINGS
+    # ======================
+    if intent == "view_meetings":
+
+        rows = await fetch_meetings_page(1)
+
+        if not rows:
+            await say("No meeting summaries found.")
+        else:
+            await say(format_meetings(rows, 1))
+
+        return
+
+    # ======================
+    # ASSIGN TASK
+    # ======================
+    if intent == "assign_task":
+
+        if not await is_manager(slack_user_id):
+            await say("❌ Only Managers can assign tasks.")
+            return
+
+        if not member_name or not description:
+            await say("⚠️ Incomplete task details.")
+            return
+
+        if deadline_text:
+            deadline = parse_deadline(deadline_text)
+        else:
+            deadline = default_deadline()
+
+        if not deadline:
+            await say("⚠️ Could not understand deadline.")
+            return
+
+        assigned_to = await _assign([(member_name, description)], deadline)
+
+        if not assigned_to:
+            await say(MEMBER_NOT_FOUND)
+            return
+
+        await say(f"✅ Task assigned to {assigned_to}. Deadline: {deadline}")
+        return
+
+    await say("⚠️ I couldn't determine your request.")
@@ -0,0 +1,304 @@
+import os
+import json
+import atexit
+import asyncio
+import logging
+import hashlib
+import groq
+import orjson
+from collections import Counter
+from threading import Lock
+from typing import Literal
+from diskcache import Cache
+from groq import AsyncGroq
+from pydantic import BaseModel, ValidationError, field_validator
+
+from bot.config import GROQ_API_KEY
+
+try:
+    import numpy as np
+    from fastembed import TextEmbedding
+except ImportError:
+    np = None
+    TextEmbedding = None
+
+log = logging.getLogger(__name__)
+
+groq_client = AsyncGroq(api_key=GROQ_API_KEY)
+
+# Running totals per failure reason ("timeout", "api_error", "bad_json",
+# "unsupported_intent"), logged with every failure so an outage or a prompt
+# regression shows up.
+intent_failures = Counter()
+
+def _record_failure(reason, detail):
+    intent_failures[reason] += 1
+    log.warning(
+        "intent extraction failed: reason=%s count=%d detail=%s",
+        reason, intent_failures[reason], detail
+    )
+
+# ==============================
+# LLM Intent Detection
+# ==============================
+INTENT_MODEL = "llama-3.1-8b-instant"
+INTENT_MAX_RETRIES = 2
+
+class Intent(BaseModel):
+    intent: Literal["assign_task", "view_tasks", "view_meetings"]
+    member_name: str | None = ""
+    description: str | None = ""
+    deadline: str | None = ""
+
+    # JSON-mode models often send null for unused fields
+    @field_validator("member_name", "description", "deadline", mode="before")
+    @classmethod
+    def _none_to_empty(cls, value):
+        return "" if value is None else value
+
+def _unsupported_intent_only(error):
+    # The model understood the format but the message is not a request we
+    # handle (e.g. chit-chat); retrying will not change that.
+    return all(
+        err["loc"] == ("intent",) and err["type"] == "literal_error"
+        for err in error.errors()
+    )
+
+# Groq caches prompt prefixes automatically, so the system prompt must stay
+# byte-identical between calls and go first. Keep it a plain constant (no
+# f-string). Any per-request context such as the team roster belongs in the
+# user message.
+_SYSTEM_PROMPT = """
+You are a Slack workflow assistant.
+
+Return ONLY pure JSON.
+
+Possible intents:
+- assign_task
+- view_tasks
+- view_meetings
+
+Format:
+{
+  "intent": "",
+  "member_name": "",
+  "description": "",
+  "deadline": ""
+}
+
+Rules:
+- If assigning → assign_task
+- If asking tasks → view_tasks
+- If asking meetings → view_meetings
+- Leave irrelevant fields empty
+"""
+
+_SYSTEM_MESSAGE = {"role": "system", "content": _SYSTEM_PROMPT}
+
+# Intents are deterministic (temperature=0), so identical messages are
+# answered from disk. The model and prompt are part of the key, so editing
+# either one invalidates old entries automatically.
+INTENT_CACHE_VERSION = "v2"
+INTENT_CACHE_TTL = 86400
+# diskcache does blocking SQLite I/O, so it is only called via
+# asyncio.to_thread to keep stalls off the event loop.
+intent_cache = Cache(os.getenv("INTENT_CACHE_DIR", "./intent_cache"))
+
+_PROMPT_HASH = hashlib.sha256(_SYSTEM_PROMPT.encode()).hexdigest()
+
+def _intent_cache_key(text):
+    normalized = text.strip().lower()
+    material = f"{INTENT_CACHE_VERSION}|{INTENT_MODEL}|{_PROMPT_HASH}|{normalized}"
+    return hashlib.sha256(material.encode()).hexdigest()
+
+# Optional semantic layer: paraphrases of an earlier message reuse its
+# intent. Needs `pip install fastembed` and SEMANTIC_CACHE=1. Two messages
+# that differ only in a member name or a date can still score above the
+# threshold, so only intents that carry no entities are cached here;
+# assign_task and view_tasks always go to the LLM.
+SEMANTIC_CACHE_INTENTS = {"view_meetings"}
+
+class SemanticCache:
+    def __init__(self, path, threshold=0.93, max_entries=5000):
+        # np.savez appends .npz itself, so normalize here for _load too
+        if not path.endswith(".npz"):
+            path += ".npz"
+
+        self.path = path
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.model = TextEmbedding("BAAI/bge-small-en-v1.5")
+        self.lock = Lock()
+        self.embeddings = None
+        self.last_used = np.zeros(max_entries, dtype=np.int64)
+        self.intents = []
+        self.clock = 0
+        self._load()
+
+    def embed(self, text):
+        emb = next(iter(self.model.embed([text.strip().lower()])))
+        return emb / np.linalg.norm(emb)
+
+    def lookup(self, emb):
+        with self.lock:
+            size = len(self.intents)
+            if not size:
+                return None
+
+            sims = self.embeddings[:size] @ emb
+            best = int(sims.argmax())
+            if sims[best] < self.threshold:
+                return None
+
+            self.clock += 1
+            self.last_used[best] = self.clock
+            return self.intents[best]
+
+    def store(self, emb, intent):
+        with self.lock:
+            if self.embeddings is None:
+                self.embeddings = np.zeros((self.max_entries, emb.shape[0]), dtype=np.float32)
+
+            if len(self.intents) < self.max_entries:
+                slot = len(self.intents)
+                self.intents.append(intent)
+            else:
+                # Evict the least recently used entry
+                slot = int(self.last_used.argmin())
+                self.intents[slot] = intent
+
+            self.clock += 1
+            self.embeddings[slot] = emb
+            self.last_used[slot] = self.clock
+
+    def save(self):
+        with self.lock:
+            size = len(self.intents)
+            if not size:
+                return
+
+            np.savez(
+                self.path,
+                embeddings=self.embeddings[:size],
+                last_used=self.last_used[:size],
+                intents=np.array([json.dumps(i) for i in self.intents])
+            )
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return
+
+        data = np.load(self.path)
+        size = min(len(data["intents"]), self.max_entries)
+
+        self.embeddings = np.zeros((self.max_entries, data["embeddings"].shape[1]), dtype=np.float32)
+        self.embeddings[:size] = data["embeddings"][:size]
+        self.last_used[:size] = data["last_used"][:size]
+        self.intents = [json.loads(i) for i in data["intents"][:size]]
+        self.clock = int(self.last_used.max())
+
+semantic_cache = None
+if TextEmbedding is not None and os.getenv("SEMANTIC_CACHE") == "1":
+    semantic_cache = SemanticCache(
+        os.getenv("SEMANTIC_CACHE_PATH", "./semantic_cache.npz"),
+        threshold=float(os.getenv("SEMANTIC_CACHE_THRESHOLD", "0.93"))
+    )
+    atexit.register(semantic_cache.save)
+
+def _cached_prompt_tokens(response):
+    details = getattr(response.usage, "prompt_tokens_details", None)
+    if getattr(details, "cached_tokens", None) is not None:
+        return details.cached_tokens
+
+    x_groq_usage = getattr(getattr(response, "x_groq", None), "usage", None)
+    return getattr(x_groq_usage, "cached_tokens", None) or 0
+
+def _load_json_object(raw):
+    # Tolerates prose or ```json fences around the object.
+    start = raw.find("{")
+    end = raw.rfind("}")
+    if start >= 0 and end > start:
+        raw = raw[start:end + 1]
+
+    return orjson.loads(raw)
+
+def _failed_generation(error):
+    # In JSON mode Groq rejects output that is not valid JSON with a 400
+    # json_validate_failed error and returns the text in failed_generation.
+    # Returns None for any other bad request.
+    body = error.body if isinstance(error.body, dict) else {}
+    body = body.get("error", body)
+    if not isinstance(body, dict) or body.get("code") != "json_validate_failed":
+        return None
+
+    return body.get("failed_generation") or ""
+
+async def extract_intent(text):
+    key = _intent_cache_key(text)
+
+    cached_intent = await asyncio.to_thread(intent_cache.get, key)
+    if cached_intent is not None:
+        return cached_intent
+
+    emb = None
+    if semantic_cache:
+        emb = await asyncio.to_thread(semantic_cache.embed, text)
+        similar_intent = semantic_cache.lookup(emb)
+        if similar_intent is not None and similar_intent["intent"] in SEMANTIC_CACHE_INTENTS:
+            return similar_intent
+
+    messages = [_SYSTEM_MESSAGE, {"role": "user", "content": text}]
+
+    # The schema is enforced by Intent; malformed or invalid output is fed
+    # back to the model with the error for another attempt.
+    for _ in range(INTENT_MAX_RETRIES + 1):
+        try:
+            response = await groq_client.chat.completions.create(
+                model=INTENT_MODEL,
+                messages=messages,
+                response_format={"type": "json_object"},
+                temperature=0
+            )
+        except groq.APITimeoutError as e:
+            _record_failure("timeout", e)
+            return None
+        except groq.BadRequestError as e:
+            raw = _failed_generation(e)
+            if raw is None:
+                _record_failure("api_error", e)
+                return None
+
+            error = e
+        except groq.APIError as e:
+            _record_failure("api_error", e)
+            return None
+        else:
+            log.info(
+                "intent completion: prompt_tokens=%s cached_tokens=%s",
+                response.usage.prompt_tokens, _cached_prompt_tokens(response)
+            )
+
+            raw = response.choices[0].message.content or ""
+
+            try:
+                parsed = Intent.model_validate(_load_json_object(raw)).model_dump()
+                break
+            except (orjson.JSONDecodeError, ValidationError) as e:
+                if isinstance(e, ValidationError) and _unsupported_intent_only(e):
+                    _record_failure("unsupported_intent", repr(raw[:200]))
+                    return None
+
+                error = e
+
+        _record_failure("bad_json", repr(raw[:200]))
+        messages = messages + [
+            {"role": "assistant", "content": raw},
+            {"role": "user", "content": f"That JSON did not match the required format:\n{error}\nReturn the corrected JSON only."}
+        ]
+    else:
+        return None
+
+    await asyncio.to_thread(intent_cache.set, key, parsed, expire=INTENT_CACHE_TTL)
+    if semantic_cache and parsed["intent"] in SEMANTIC_CACHE_INTENTS:
+        semantic_cache.store(emb, parsed)
+    return parsed
@@ -0,0 +1,83 @@
+import asyncio
+import logging
+import psycopg
+from cachetools import TTLCache
+
+from bot.db import get_conn
+
+log = logging.getLogger(__name__)
+
+# ==============================
+# Member Directory
+# ==============================
+# members is small and rarely changes, so the whole table is held in
+# memory and reloaded every MEMBER_REFRESH_SECONDS. Each refresh builds new
+# dicts and rebinds the globals, so readers never see a half-built map.
+MEMBER_REFRESH_SECONDS = 300
+
+MEMBERS_BY_SLACK = {}  # slack_user_id -> (member_id, designation)
+MEMBERS_BY_NAME = {}   # lower(member_name) -> member_id
+
+async def refresh_members():
+    global MEMBERS_BY_SLACK, MEMBERS_BY_NAME
+
+    async with get_conn() as conn, conn.cursor() as cur:
+        await cur.execute("""
+            SELECT member_id, slack_user_id, lower(member_name), designation
+            FROM members
+        """)
+
+        rows = await cur.fetchall()
+
+    MEMBERS_BY_SLACK = {
+        slack_id: (member_id, (designation or "").lower())
+        for member_id, slack_id, _, designation in rows if slack_id
+    }
+    MEMBERS_BY_NAME = {name: member_id for member_id, _, name, _ in rows if name}
+
+async def refresh_members_periodically():
+    while True:
+        try:
+            await refresh_members()
+        except psycopg.Error:
+            log.exception("member directory refresh failed")
+
+        await asyncio.sleep(MEMBER_REFRESH_SECONDS)
+
+def member_id_for(member_name):
+    # None when the name is not in the directory (e.g. added since the
+    # last refresh); callers then fall back to a database lookup.
+    return MEMBERS_BY_NAME.get(member_name.strip().lower())
+
+# ==============================
+# Role-Based Access Control
+# ==============================
+async def is_manager(slack_user_id):
+    member = MEMBERS_BY_SLACK.get(slack_user_id)
+    if member is not None:
+        return member[1] == "manager"
+
+    return await _lookup_is_manager(slack_user_id)
+
+# Directory misses fall back to the database, cached per Slack user.
+# /refresh-roles clears the cache after a promotion or demotion.
+_role_cache = TTLCache(maxsize=1024, ttl=300)
+
+def clear_role_cache():
+    _role_cache.clear()
+
+async def _lookup_is_manager(slack_user_id):
+    if slack_user_id in _role_cache:
+        return _role_cache[slack_user_id]
+
+    async with get_conn() as conn, conn.cursor() as cur:
+        await cur.execute("""
+            SELECT designation FROM members
+            WHERE slack_user_id = %s
+        """, (slack_user_id,))
+
+        row = await cur.fetchone()
+
+    result = bool(row) and (row[0] or "").lower() == "manager"
+    _role_cache[slack_user_id] = result
+    return result
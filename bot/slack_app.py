@@ -0,0 +1,36 @@
+import asyncio
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Request
+from slack_bolt.async_app import AsyncApp
+from slack_bolt.adapter.fastapi.async_handler import AsyncSlackRequestHandler
+
+from bot import handlers
+from bot.config import AI_MODE, SLACK_BOT_TOKEN, SLACK_SIGNING_SECRET
+from bot.db import db_pool
+from bot.roles import refresh_members_periodically
+
+# ==============================
+# Initialize Slack
+# ==============================
+app = AsyncApp(token=SLACK_BOT_TOKEN, signing_secret=SLACK_SIGNING_SECRET)
+handlers.register(app, ai_mode=AI_MODE)
+
+# ==============================
+# HTTP Server
+# ==============================
+@asynccontextmanager
+async def lifespan(_):
+    await db_pool.open()
+    refresher = asyncio.create_task(refresh_members_periodically())
+
+    yield
+
+    refresher.cancel()
+    await db_pool.close()
+
+api = FastAPI(lifespan=lifespan)
+slack_handler = AsyncSlackRequestHandler(app)
+
+@api.post("/slack/events")
+async def slack_events(req: Request):
+    return await slack_handler.handle(req)
@@ -0,0 +1,3 @@
+-- Member lookups match on lower(member_name) = lower(%s); this index lets
+-- them use an index scan instead of a sequential scan over members.
+CREATE INDEX IF NOT EXISTS idx_members_name_lower ON members (lower(member_name));
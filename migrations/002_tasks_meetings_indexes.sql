@@ -0,0 +1,6 @@
+-- Task lists join on member_id and sort by deadline; the compound index
+-- serves both, so a member's tasks come from an index scan in order.
+CREATE INDEX IF NOT EXISTS idx_tasks_member_deadline ON tasks (member_id, deadline);
+
+-- Meeting pages read the newest meetings first.
+CREATE INDEX IF NOT EXISTS idx_meetings_date ON meetings (meeting_date DESC);